@@ -1,48 +1,314 @@
 import csv
+import io
+import json
+import math
 import os
+import re
+import sys
+from array import array
+from calendar import monthrange
+from collections import defaultdict
 from datetime import datetime
-import matplotlib.pyplot as plt
+from itertools import islice
+from operator import itemgetter
+
+# Layout of the binary copy: bumped whenever the format changes
+_BINARY_VERSION = 2
+_BINARY_COLUMNS = (('month_keys', 'l'), ('categories', 'H'), ('amounts', 'q'))
+
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+def _is_valid_date(date_str):
+    """Check that a string is a real calendar date in YYYY-MM-DD form"""
+    match = _DATE_RE.match(date_str)
+    if not match:
+        return False
+    year, month, day = map(int, match.groups())
+    return year >= 1 and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]
+
+# Leading year and month of a date; single-digit months from older files are accepted
+_MONTH_RE = re.compile(r'(\d{4})-(\d{1,2})(?!\d)')
+
+# Month key for dates that don't parse; larger than any real key so it sorts last
+_UNKNOWN_MONTH = 2 ** 31 - 1
+
+def _month_key(date):
+    """Encode the YYYY-MM part of a date as year * 12 + (month - 1)"""
+    # Fast path for the usual well-formed YYYY-MM-DD (or YYYY-MM) date
+    if date[4:5] == '-' and date[7:8] in ('-', '') and date[:4].isdecimal() and date[5:7].isdecimal():
+        month = int(date[5:7])
+        if 1 <= month <= 12:
+            return int(date[:4]) * 12 + month - 1
+        return _UNKNOWN_MONTH
+    match = _MONTH_RE.match(date)
+    if match:
+        year, month = int(match.group(1)), int(match.group(2))
+        if 1 <= month <= 12:
+            return year * 12 + month - 1
+    return _UNKNOWN_MONTH
+
+# Rows parsed per batch when loading the CSV, bounding the temporary row lists
+LOAD_CHUNK_SIZE = 100_000
+
+# Largest amount that fits the int64 cents column
+_MAX_CENTS = 2 ** 63 - 1
+
+def _to_cents(amount):
+    """Convert a dollar amount (number or string) to integer cents"""
+    # Going through the :.2f text keeps the cents identical to what the tracker has always
+    # displayed; float(amount) * 100 would turn 12.345 into 1234 instead of 1235
+    return int(f"{float(amount):.2f}".replace('.', ''))
+
+def _month_label(key):
+    """Format an integer month key back as YYYY-MM"""
+    if key == _UNKNOWN_MONTH:
+        return "Unknown"
+    return f"{key // 12:04d}-{key % 12 + 1:02d}"
+
+def _scan_months(keys, amounts):
+    """Sum amounts per month key and find the highest expense in one pass"""
+    monthly_totals = defaultdict(int)
+    highest, highest_amount = 0, amounts[0]
+    for i, (key, amount) in enumerate(zip(keys, amounts)):
+        monthly_totals[key] += amount
+        if amount > highest_amount:
+            highest, highest_amount = i, amount
+    return monthly_totals, highest
 
 class ExpenseTracker:
+    CATEGORY_COLORS = ('red', 'blue', 'green', 'orange', 'purple', 'brown')
+    _MAIN_MENU = ("\nMain Menu:\n"
+                  "1. Add an Expense\n"
+                  "2. View All Expenses\n"
+                  "3. Generate Report\n"
+                  "4. Visualize Expenses\n"
+                  "5. Save and Exit")
+    
     def __init__(self, filename="expenses.csv"):
         self.filename = filename
-        self.expenses = []
+        # Binary copy of the columns, loaded instead of the CSV while the CSV is unchanged
+        self.filename_bin = filename + ".bin"
         self.categories = ["Food", "Transport", "Entertainment", "Utilities", "Healthcare", "Other"]
+        # Category prompts never change, so build them once
+        self._n_categories = len(self.categories)
+        self._category_menu = "\nAvailable categories:\n" + "\n".join(
+            f"{i}. {category}" for i, category in enumerate(self.categories, 1))
+        self._category_prompt = f"Select category (1-{self._n_categories}): "
+        self._reset_columns()
         self.load_expenses()
     
+    def _reset_columns(self):
+        """Clear the column storage"""
+        # Expenses are stored column-wise: one typed array per numeric field,
+        # amounts in integer cents, categories as small integer codes into
+        # self._category_labels.
+        self._dates = []
+        self._month_keys = array('l')
+        self._categories = array('H')
+        self._amounts = array('q')
+        self._descriptions = []
+        self._category_labels = list(self.categories)
+        self._category_codes = {category: i for i, category in enumerate(self._category_labels)}
+        # Running totals, kept up to date on every insert
+        self._category_totals = [0] * len(self._category_labels)
+        self._grand_total = 0
+        # CSV rows whose amount can't be stored (nan, inf, too large), written back unchanged on save
+        self._invalid_rows = []
+    
+    def _category_code(self, category):
+        """Return the integer code for a category, registering unknown ones"""
+        code = self._category_codes.get(category)
+        if code is None:
+            code = len(self._category_labels)
+            self._category_labels.append(category)
+            self._category_codes[category] = code
+            self._category_totals.append(0)
+        return code
+    
+    def _append(self, date, category, amount, description):
+        """Append a single expense to the columns"""
+        # Derive everything first so the columns only change once nothing can fail
+        code = self._category_code(category)
+        month_key = _month_key(date)
+        self._dates.append(date)
+        self._month_keys.append(month_key)
+        self._categories.append(code)
+        self._amounts.append(amount)
+        self._descriptions.append(description)
+        self._category_totals[code] += amount
+        self._grand_total += amount
+    
+    def _extend(self, dates, categories, cents, descriptions):
+        """Append whole columns of expenses, converting each column in bulk"""
+        # Convert into temporaries first so a bad value leaves the columns in step
+        month_keys = array('l', map(_month_key, dates))
+        codes = array('H', map(self._category_code, categories))
+        self._dates.extend(dates)
+        self._month_keys.extend(month_keys)
+        self._categories.extend(codes)
+        self._amounts.extend(cents)
+        self._descriptions.extend(descriptions)
+        self._update_totals(codes, cents)
+    
+    def _update_totals(self, codes, amounts):
+        """Fold newly added category codes and amounts into the totals"""
+        # Works on the new columns directly, without slicing copies out of the stored ones;
+        # integer cents, so the running sums stay exact
+        totals = self._category_totals
+        for code, amount in zip(codes, amounts):
+            totals[code] += amount
+        self._grand_total += sum(amounts)
+    
+    def _split_invalid(self, rows):
+        """Set aside rows whose amount can't be stored, returning the rest and their cents"""
+        valid = []
+        cents = array('q')
+        for row in rows:
+            try:
+                # append raises OverflowError for amounts that don't fit in int64
+                cents.append(_to_cents(row[2]))
+            except (ValueError, OverflowError):
+                self._invalid_rows.append(list(row))
+                continue
+            valid.append(row)
+        return valid, cents
+    
+    def _csv_signature(self):
+        """Size and nanosecond mtime of the CSV, recorded in the binary copy"""
+        stat = os.stat(self.filename)
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def _load_binary(self):
+        """Load the columns from the binary copy, returning False if it doesn't match the CSV"""
+        with open(self.filename_bin, 'rb') as file:
+            header = json.loads(file.readline())
+            if header.get('version') != _BINARY_VERSION or header.get('csv') != self._csv_signature():
+                return False
+            count = header['count']
+            columns = {}
+            for name, typecode in _BINARY_COLUMNS:
+                column = array(typecode)
+                if header['itemsizes'][name] != column.itemsize:
+                    return False
+                column.fromfile(file, count)
+                if header['byteorder'] != sys.byteorder:
+                    column.byteswap()
+                columns[name] = column
+        if len(header['dates']) != count or len(header['descriptions']) != count:
+            raise ValueError("column lengths don't match")
+        
+        # Category codes are re-mapped in case the label order differs from this run's
+        remap = array('H', map(self._category_code, header['labels']))
+        codes = array('H', map(remap.__getitem__, columns['categories']))
+        self._dates.extend(header['dates'])
+        self._month_keys.extend(columns['month_keys'])
+        self._categories.extend(codes)
+        self._amounts.extend(columns['amounts'])
+        self._descriptions.extend(header['descriptions'])
+        self._invalid_rows.extend(header['invalid_rows'])
+        self._update_totals(codes, columns['amounts'])
+        return True
+    
+    def _save_binary(self):
+        """Save the columns to the binary copy"""
+        # A JSON header line with the string columns, followed by the raw numeric arrays
+        header = {
+            'version': _BINARY_VERSION,
+            'csv': self._csv_signature(),
+            'byteorder': sys.byteorder,
+            'count': len(self._amounts),
+            'itemsizes': {name: array(typecode).itemsize for name, typecode in _BINARY_COLUMNS},
+            'labels': self._category_labels,
+            'dates': self._dates,
+            'descriptions': self._descriptions,
+            'invalid_rows': self._invalid_rows
+        }
+        with open(self.filename_bin, 'wb') as file:
+            file.write(json.dumps(header).encode('utf-8') + b"\n")
+            for name, _ in _BINARY_COLUMNS:
+                getattr(self, '_' + name).tofile(file)
+    
     def load_expenses(self):
-        """Load expenses from CSV file"""
+        """Load expenses from the binary copy if current, otherwise the CSV file"""
+        if os.path.exists(self.filename) and os.path.exists(self.filename_bin):
+            try:
+                if self._load_binary():
+                    print(f"Loaded {len(self._amounts)} expenses from {self.filename}")
+                    return
+            except Exception as e:
+                print(f"Error loading {self.filename_bin}, falling back to CSV: {e}")
+                self._reset_columns()
+        
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r', newline='') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        # Convert amount to float
-                        row['amount'] = float(row['amount'])
-                        self.expenses.append(row)
-                print(f"Loaded {len(self.expenses)} expenses from {self.filename}")
+                # A large read buffer keeps the number of read() calls low on big files
+                with open(self.filename, 'r', newline='', buffering=1 << 20) as file:
+                    reader = csv.reader(file)
+                    header = next(reader, None)
+                    if header is not None:
+                        # Only pick out the columns we use, in whatever order the file has them
+                        columns = [header.index(name) for name in ('date', 'category', 'amount', 'description')]
+                        pick = itemgetter(*columns)
+                        width = max(columns) + 1
+                        padding = [''] * width
+                        # Fold the file in one chunk at a time so only a chunk of rows is ever held
+                        while True:
+                            chunk = list(islice(reader, LOAD_CHUNK_SIZE))
+                            if not chunk:
+                                break
+                            try:
+                                rows = list(map(pick, filter(None, chunk)))
+                            except IndexError:
+                                # Rare: short rows (e.g. no trailing description) are padded with empty fields
+                                rows = [pick(row if len(row) >= width else row + padding) for row in chunk if row]
+                            if not rows:
+                                continue
+                            dates, categories, amounts, descriptions = zip(*rows)
+                            try:
+                                cents = array('q', map(_to_cents, amounts))
+                            except (ValueError, OverflowError):
+                                # Rare: a row with an unusable amount; don't let it fail the whole file
+                                rows, cents = self._split_invalid(rows)
+                                if not rows:
+                                    continue
+                                dates, categories, amounts, descriptions = zip(*rows)
+                            self._extend(dates, categories, cents, descriptions)
+                print(f"Loaded {len(self._amounts)} expenses from {self.filename}")
+                if self._invalid_rows:
+                    print(f"Skipped {len(self._invalid_rows)} expenses with invalid amounts; "
+                          "they are kept in the file unchanged")
             except Exception as e:
                 print(f"Error loading expenses: {e}")
-                self.expenses = []
+                self._reset_columns()
         else:
             print("No existing expense file found. Starting fresh.")
     
     def save_expenses(self):
-        """Save expenses to CSV file"""
+        """Save expenses to the CSV file and its binary copy"""
         try:
             with open(self.filename, 'w', newline='') as file:
-                if self.expenses:
-                    fieldnames = self.expenses[0].keys()
-                    writer = csv.DictWriter(file, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.expenses)
-                else:
-                    # Create empty file with headers
-                    writer = csv.DictWriter(file, fieldnames=['date', 'category', 'amount', 'description'])
-                    writer.writeheader()
+                writer = csv.writer(file)
+                writer.writerow(['date', 'category', 'amount', 'description'])
+                labels = self._category_labels
+                writer.writerows(zip(self._dates, (labels[code] for code in self._categories),
+                                     (f"{cents / 100:.2f}" for cents in self._amounts),
+                                     self._descriptions))
+                writer.writerows(self._invalid_rows)
             print(f"Expenses saved to {self.filename}")
         except Exception as e:
             print(f"Error saving expenses: {e}")
+            return
+        
+        # Written after the CSV, since it records the CSV's size and mtime. The expenses are
+        # already safe at this point, so a failure here only costs the faster next load.
+        try:
+            self._save_binary()
+        except Exception as e:
+            print(f"Could not write the load cache {self.filename_bin}: {e}")
+            try:
+                os.remove(self.filename_bin)
+            except OSError:
+                pass
     
     def add_expense(self):
         """Add a new expense"""
@@ -52,7 +318,11 @@ class ExpenseTracker:
         while True:
             try:
                 amount = float(input("Enter expense amount: $"))
-                if amount <= 0:
+                if not math.isfinite(amount) or abs(amount) * 100 > _MAX_CENTS:
+                    raise ValueError(amount)
+                # Checked in cents, since that's what gets stored
+                cents = _to_cents(amount)
+                if cents <= 0:
                     print("Amount must be positive. Please try again.")
                     continue
                 break
@@ -60,18 +330,16 @@ class ExpenseTracker:
                 print("Invalid input. Please enter a valid number.")
         
         # Get category with validation
-        print("\nAvailable categories:")
-        for i, category in enumerate(self.categories, 1):
-            print(f"{i}. {category}")
+        print(self._category_menu)
         
         while True:
             try:
-                category_choice = int(input(f"Select category (1-{len(self.categories)}): "))
-                if 1 <= category_choice <= len(self.categories):
+                category_choice = int(input(self._category_prompt))
+                if 1 <= category_choice <= self._n_categories:
                     category = self.categories[category_choice - 1]
                     break
                 else:
-                    print(f"Please enter a number between 1 and {len(self.categories)}")
+                    print(f"Please enter a number between 1 and {self._n_categories}")
             except ValueError:
                 print("Invalid input. Please enter a number.")
         
@@ -81,113 +349,106 @@ class ExpenseTracker:
             if not date_str:
                 date_str = datetime.now().strftime("%Y-%m-%d")
                 break
-            try:
-                datetime.strptime(date_str, "%Y-%m-%d")
+            if _is_valid_date(date_str):
                 break
-            except ValueError:
-                print("Invalid date format. Please use YYYY-MM-DD format.")
+            print("Invalid date format. Please use YYYY-MM-DD format.")
         
         # Get description
         description = input("Enter description (optional): ").strip()
         
-        # Create expense dictionary
-        expense = {
-            'date': date_str,
-            'category': category,
-            'amount': amount,
-            'description': description
-        }
-        
-        self.expenses.append(expense)
-        print(f"Expense of ${amount:.2f} added successfully!")
+        self._append(date_str, category, cents, description)
+        print(f"Expense of ${cents / 100:.2f} added successfully!")
     
     def view_expenses(self):
         """View all expenses"""
-        if not self.expenses:
+        if not self._amounts:
             print("\nNo expenses recorded yet.")
             return
         
-        print("\n--- All Expenses ---")
-        print(f"{'Date':<12} {'Category':<15} {'Amount':<10} {'Description'}")
-        print("-" * 50)
+        # Format whole columns straight into one buffer and write the table out in one go
+        buf = io.StringIO()
+        buf.write("\n--- All Expenses ---\n")
+        buf.write(f"{'Date':<12} {'Category':<15} {'Amount':<10} {'Description'}\n")
+        buf.write("-" * 50 + "\n")
         
-        total = 0
-        for expense in self.expenses:
-            print(f"{expense['date']:<12} {expense['category']:<15} ${expense['amount']:<9.2f} {expense['description']}")
-            total += expense['amount']
+        row_format = "{:<12} {:<15} ${:<9.2f} {}\n".format
+        categories = map(self._category_labels.__getitem__, self._categories)
+        amounts = (cents / 100 for cents in self._amounts)
+        buf.writelines(map(row_format, self._dates, categories, amounts, self._descriptions))
+        total = self._grand_total / 100
         
-        print("-" * 50)
-        print(f"{'Total':<27} ${total:<9.2f}")
+        buf.write("-" * 50 + "\n")
+        buf.write(f"{'Total':<27} ${total:<9.2f}\n")
+        sys.stdout.write(buf.getvalue())
     
     def generate_report(self):
         """Generate expense reports"""
-        if not self.expenses:
+        if not self._amounts:
             print("\nNo expenses recorded yet.")
             return
         
         print("\n--- Expense Report ---")
         
         # Total spending
-        total_spent = sum(expense['amount'] for expense in self.expenses)
-        print(f"Total Spending: ${total_spent:.2f}")
+        total_spent = self._grand_total
+        print(f"Total Spending: ${total_spent / 100:.2f}")
         
         # Spending by category
         print("\nSpending by Category:")
         print("-" * 30)
         category_totals = {}
-        for category in self.categories:
-            category_total = sum(expense['amount'] for expense in self.expenses if expense['category'] == category)
-            category_totals[category] = category_total
+        for category, category_total in zip(self.categories, self._category_totals):
+            category_totals[category] = category_total / 100
             if category_total > 0:
                 percentage = (category_total / total_spent) * 100
-                print(f"{category:<15}: ${category_total:<8.2f} ({percentage:.1f}%)")
+                print(f"{category:<15}: ${category_total / 100:<8.2f} ({percentage:.1f}%)")
+        
+        # Monthly totals and the highest expense come from the same pass
+        monthly_totals, highest = _scan_months(self._month_keys, self._amounts)
         
         # Highest expense
-        if self.expenses:
-            highest_expense = max(self.expenses, key=lambda x: x['amount'])
-            print(f"\nHighest Expense: ${highest_expense['amount']:.2f} on {highest_expense['category']} ({highest_expense['date']})")
+        highest_category = self._category_labels[self._categories[highest]]
+        print(f"\nHighest Expense: ${self._amounts[highest] / 100:.2f} on {highest_category} ({self._dates[highest]})")
         
         # Monthly spending (if we have enough data)
-        monthly_totals = {}
-        for expense in self.expenses:
-            month = expense['date'][:7]  # YYYY-MM
-            monthly_totals[month] = monthly_totals.get(month, 0) + expense['amount']
-        
         if len(monthly_totals) > 1:
             print("\nMonthly Spending:")
             for month, total in sorted(monthly_totals.items()):
-                print(f"  {month}: ${total:.2f}")
+                print(f"  {_month_label(month)}: ${total / 100:.2f}")
         
         return category_totals
     
     def visualize_expenses(self):
         """Create visualizations of expenses"""
-        if not self.expenses:
+        if not self._amounts:
             print("\nNo expenses recorded yet.")
             return
         
-        category_totals = {}
-        for category in self.categories:
-            category_total = sum(expense['amount'] for expense in self.expenses if expense['category'] == category)
+        # Chart labels and values are collected straight into the lists matplotlib takes
+        categories = []
+        amounts = []
+        for category, category_total in zip(self.categories, self._category_totals):
             if category_total > 0:
-                category_totals[category] = category_total
+                categories.append(category)
+                amounts.append(category_total / 100)
         
-        if not category_totals:
+        if not categories:
             print("No expenses to visualize.")
             return
         
+        # Imported here so startup doesn't pay for matplotlib unless charts are used
+        import matplotlib.pyplot as plt
+        
         # Create pie chart
         plt.figure(figsize=(12, 5))
         
         plt.subplot(1, 2, 1)
-        plt.pie(category_totals.values(), labels=category_totals.keys(), autopct='%1.1f%%', startangle=90)
+        plt.pie(amounts, labels=categories, autopct='%1.1f%%', startangle=90)
         plt.title('Expense Distribution by Category')
         
         # Create bar chart
         plt.subplot(1, 2, 2)
-        categories = list(category_totals.keys())
-        amounts = list(category_totals.values())
-        plt.bar(categories, amounts, color=['red', 'blue', 'green', 'orange', 'purple', 'brown'])
+        plt.bar(categories, amounts, color=self.CATEGORY_COLORS[:len(categories)])
         plt.title('Expenses by Category')
         plt.xlabel('Categories')
         plt.ylabel('Amount ($)')
@@ -196,37 +457,39 @@ class ExpenseTracker:
         plt.tight_layout()
         plt.show()
     
+    def _save_and_exit(self):
+        """Save expenses and signal the main loop to stop"""
+        self.save_expenses()
+        print("Thank you for using Personal Expense Tracker. Goodbye!")
+        return True
+    
+    def _invalid_choice(self):
+        """Report a menu choice that is out of range"""
+        print("Invalid choice. Please enter a number between 1 and 5.")
+    
     def run(self):
         """Main program loop"""
         print("=" * 50)
         print("    Welcome to Personal Expense Tracker!")
         print("=" * 50)
         
+        # Menu choices dispatch through a table; only "Save and Exit" returns True to stop
+        actions = {
+            1: self.add_expense,
+            2: self.view_expenses,
+            3: self.generate_report,
+            4: self.visualize_expenses,
+            5: self._save_and_exit
+        }
+        
         while True:
-            print("\nMain Menu:")
-            print("1. Add an Expense")
-            print("2. View All Expenses")
-            print("3. Generate Report")
-            print("4. Visualize Expenses")
-            print("5. Save and Exit")
+            print(self._MAIN_MENU)
             
             try:
                 choice = int(input("\nEnter your choice (1-5): "))
                 
-                if choice == 1:
-                    self.add_expense()
-                elif choice == 2:
-                    self.view_expenses()
-                elif choice == 3:
-                    self.generate_report()
-                elif choice == 4:
-                    self.visualize_expenses()
-                elif choice == 5:
-                    self.save_expenses()
-                    print("Thank you for using Personal Expense Tracker. Goodbye!")
+                if actions.get(choice, self._invalid_choice)() is True:
                     break
-                else:
-                    print("Invalid choice. Please enter a number between 1 and 5.")
             
             except ValueError:
                 print("Invalid input. Please enter a number.")
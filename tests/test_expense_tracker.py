@@ -0,0 +1,83 @@
+import contextlib
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "Personal Expense Tracker.py")
+spec = importlib.util.spec_from_file_location("expense_tracker", MODULE_PATH)
+expense_tracker = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(expense_tracker)
+
+
+class ExpenseTrackerLoadTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "expenses.csv")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_csv(self, text):
+        with open(self.filename, "w", newline="") as file:
+            file.write(text)
+
+    def make_tracker(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return expense_tracker.ExpenseTracker(self.filename)
+
+    def save(self, tracker):
+        with contextlib.redirect_stdout(io.StringIO()):
+            tracker.save_expenses()
+
+    def test_invalid_amounts_do_not_drop_the_file(self):
+        # Rows the baseline could write: nan and inf passed its "amount <= 0" check
+        self.write_csv("date,category,amount,description\r\n"
+                       "2024-01-05,Food,12.5,lunch\r\n"
+                       "2024-01-06,Food,nan,bad\r\n"
+                       "2024-01-07,Other,inf,worse\r\n"
+                       "2024-01-08,Other,1e300,huge\r\n"
+                       "2024-02-01,Transport,3.25,bus\r\n")
+        tracker = self.make_tracker()
+        self.assertEqual(list(tracker._amounts), [1250, 325])
+        self.assertEqual(tracker._grand_total, 1575)
+
+        self.save(tracker)
+        with open(self.filename, newline="") as file:
+            saved = file.read()
+        for row in ("2024-01-06,Food,nan,bad", "2024-01-07,Other,inf,worse", "2024-01-08,Other,1e300,huge"):
+            self.assertIn(row, saved)
+
+        # The kept rows survive a reload through the binary copy as well as the CSV
+        for remove_binary in (False, True):
+            if remove_binary:
+                os.remove(self.filename + ".bin")
+            reloaded = self.make_tracker()
+            self.assertEqual(list(reloaded._amounts), [1250, 325])
+            self.assertEqual(len(reloaded._invalid_rows), 3)
+
+    def test_cents_match_the_two_decimal_display(self):
+        self.write_csv("date,category,amount,description\r\n"
+                       "2024-01-05,Food,12.345,lunch\r\n"
+                       "2024-01-06,Food,2.675,snack\r\n"
+                       "2024-01-07,Food,-1.5,refund\r\n")
+        tracker = self.make_tracker()
+        self.assertEqual(list(tracker._amounts), [1235, 267, -150])
+        for value in (12.345, 2.675, 0.015, 1e15 + 0.125):
+            self.assertEqual(expense_tracker._to_cents(value), int(f"{value:.2f}".replace(".", "")))
+
+    def test_binary_copy_failure_does_not_fail_the_save(self):
+        self.write_csv("date,category,amount,description\r\n2024-01-05,Food,12.5,lunch\r\n")
+        tracker = self.make_tracker()
+        os.mkdir(self.filename + ".bin")  # makes writing the binary copy fail
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            tracker.save_expenses()
+        self.assertIn(f"Expenses saved to {self.filename}", output.getvalue())
+        self.assertNotIn("Error saving expenses", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()